@@ -22,20 +22,35 @@ from pxr import Usd, UsdGeom
 import newton
 import newton.examples
 import newton.utils
-from newton.geometry import PARTICLE_FLAG_ACTIVE, Mesh
+from newton.geometry import PARTICLE_FLAG_ACTIVE_MASK, Mesh
+
+
+@wp.kernel
+def advance_time(dt: float, sim_time: wp.array(dtype=float)):
+    sim_time[0] = sim_time[0] + dt
+
+
+def _ingest_usd_mesh(points, indices, uv, uv_indices, uv_scale):
+    """Convert USD mesh attributes into the contiguous arrays expected by the builder in a single pass."""
+    # np.asarray wraps the USD buffers without copying when the dtype already matches
+    points = np.asarray(points, dtype=np.float32)
+    indices = np.asarray(indices, dtype=np.int32)
+    uv_indices = np.asarray(uv_indices, dtype=np.int32)
+    # the wrapped USD buffer is read-only, so the scaled UVs are the only new buffer
+    uv = np.multiply(np.asarray(uv, dtype=np.float32), np.float32(uv_scale))
+    return points, indices, uv, uv_indices
 
 
 class Example:
-    def __init__(self, stage_path="example_cloth_style3d.usd", num_frames=600):
+    def __init__(self, stage_path="example_cloth_style3d.usd", num_frames=600, enable_profiling=False):
         fps = 60
         self.frame_dt = 1.0 / fps
-        # must be an even number when using CUDA Graph
         self.num_substeps = 2
         self.iterations = 20
         self.dt = self.frame_dt / self.num_substeps
         self.num_frames = num_frames
-        self.sim_time = 0.0
         self.profiler = {}
+        self.enable_profiling = enable_profiling
         self.use_cuda_graph = wp.get_device().is_cuda
 
         usd_stage = Usd.Stage.Open(os.path.join(newton.examples.get_asset_directory(), "women_skirt.usda"))
@@ -43,15 +58,18 @@ class Example:
         # Grament
         usd_geom_garment = UsdGeom.Mesh(usd_stage.GetPrimAtPath("/Root/women_skirt/Root_Garment"))
         garment_prim = UsdGeom.PrimvarsAPI(usd_geom_garment.GetPrim()).GetPrimvar("st")
-        garment_mesh_indices = np.array(usd_geom_garment.GetFaceVertexIndicesAttr().Get())
-        garment_mesh_points = np.array(usd_geom_garment.GetPointsAttr().Get())
-        garment_mesh_uv_indices = np.array(garment_prim.GetIndices())
-        garment_mesh_uv = np.array(garment_prim.Get()) * 1e-3
+        garment_mesh_points, garment_mesh_indices, garment_mesh_uv, garment_mesh_uv_indices = _ingest_usd_mesh(
+            usd_geom_garment.GetPointsAttr().Get(),
+            usd_geom_garment.GetFaceVertexIndicesAttr().Get(),
+            garment_prim.Get(),
+            garment_prim.GetIndices(),
+            uv_scale=1e-3,
+        )
 
         # Avatar
         usd_geom_avatar = UsdGeom.Mesh(usd_stage.GetPrimAtPath("/Root/women_skirt/Root_SkinnedMesh_Avatar_0_Sub_0"))
-        avatar_mesh_indices = np.array(usd_geom_avatar.GetFaceVertexIndicesAttr().Get())
-        avatar_mesh_points = np.array(usd_geom_avatar.GetPointsAttr().Get())
+        avatar_mesh_indices = np.asarray(usd_geom_avatar.GetFaceVertexIndicesAttr().Get(), dtype=np.int32)
+        avatar_mesh_points = np.asarray(usd_geom_avatar.GetPointsAttr().Get(), dtype=np.float32)
 
         builder = newton.sim.Style3DModelBuilder(up_axis=newton.Axis.Y)
         use_cloth_mesh = True
@@ -62,10 +80,10 @@ class Example:
                 vel=wp.vec3(0.0, 0.0, 0.0),
                 tri_aniso_ke=wp.vec3(1.0e2, 1.0e2, 1.0e1),
                 edge_aniso_ke=wp.vec3(2.0e-5, 1.0e-5, 5.0e-6),
-                panel_verts=garment_mesh_uv.tolist(),
-                panel_indices=garment_mesh_uv_indices.tolist(),
-                vertices=garment_mesh_points.tolist(),
-                indices=garment_mesh_indices.tolist(),
+                panel_verts=garment_mesh_uv,
+                panel_indices=garment_mesh_uv_indices,
+                vertices=garment_mesh_points,
+                indices=garment_mesh_indices,
                 density=0.3,
                 scale=1.0,
             )
@@ -98,9 +116,8 @@ class Example:
 
         # set fixed points
         flags = self.model.particle_flags.numpy()
-        for fixed_vertex_id in fixed_points:
-            flags[fixed_vertex_id] = wp.uint32(int(flags[fixed_vertex_id]) & ~int(PARTICLE_FLAG_ACTIVE))
-        self.model.particle_flags = wp.array(flags)
+        flags[np.asarray(fixed_points, dtype=np.int64)] &= PARTICLE_FLAG_ACTIVE_MASK
+        self.model.particle_flags.assign(flags)
 
         # set up contact query and contact detection distances
         self.model.soft_contact_radius = 0.2
@@ -113,9 +130,12 @@ class Example:
         self.solver.precompute(
             builder,
         )
-        self.state0 = self.model.state()
-        self.state1 = self.model.state()
+        # ping-pong states, self._p is the index of the current state
+        self._states = [self.model.state(), self.model.state()]
+        self._p = 0
         self.control = self.model.control()
+        # the simulation time is advanced on device so that a frame is a single graph launch
+        self.sim_time_dev = wp.zeros(1, dtype=float)
 
         self.renderer = None
         if stage_path:
@@ -126,36 +146,108 @@ class Example:
             self.renderer.draw_grid = True
             self.renderer.paused = True
 
-        self.cuda_graph = None
+        # read back particle positions into pinned host memory on a separate stream, so that run()
+        # can draw a frame on the host while the next one is being simulated on the device
+        self.render_stream = None
+        if self.use_cuda_graph and self.renderer is not None:
+            self.render_stream = wp.Stream()
+            self.render_event = wp.Event()
+            self.render_state = newton.State()
+            # start from the initial state, so that render() before the first frame draws it
+            self.render_state.particle_q = wp.clone(self.state.particle_q, device="cpu", pinned=True)
+            self.render_time = wp.clone(self.sim_time_dev, device="cpu", pinned=True)
+
+        # capture one graph per starting parity, with an odd number of substeps the parity
+        # alternates from frame to frame and both graphs are replayed in turn
+        self.cuda_graphs = [None, None]
         if self.use_cuda_graph:
             with wp.ScopedCapture() as capture:
                 self.integrate_frame_substeps()
-            self.cuda_graph = capture.graph
+            self.cuda_graphs[0] = capture.graph
+            if self.num_substeps % 2 == 1:
+                with wp.ScopedCapture() as capture:
+                    self.integrate_frame_substeps()
+                self.cuda_graphs[1] = capture.graph
+
+    @property
+    def state(self):
+        return self._states[self._p]
+
+    def integrate_substep(self):
+        self.solver.step(self.model, self._states[self._p], self._states[1 - self._p], self.control, None, self.dt)
+        self._p ^= 1
 
     def integrate_frame_substeps(self):
+        # the substeps are unrolled into the captured graph, Style3DSolver.step allocates
+        # reduction scratch memory, which is not allowed inside a conditional graph body
         for _ in range(self.num_substeps):
-            self.solver.step(self.model, self.state0, self.state1, self.control, None, self.dt)
-            (self.state0, self.state1) = (self.state1, self.state0)
+            self.integrate_substep()
+        wp.launch(advance_time, dim=1, inputs=[self.dt], outputs=[self.sim_time_dev])
+
+    def simulate_frame(self):
+        if self.use_cuda_graph:
+            wp.capture_launch(self.cuda_graphs[self._p])
+            self._p ^= self.num_substeps % 2
+        else:
+            self.integrate_frame_substeps()
+
+    def step_frame(self):
+        # a graph launch returns as soon as it is enqueued, so the timer has to synchronize to
+        # record the frame time, which would stall the pipelined run() and is only done when profiling
+        if self.enable_profiling:
+            with wp.ScopedTimer("step", print=False, dict=self.profiler, synchronize=True):
+                self.simulate_frame()
+        else:
+            self.simulate_frame()
+
+    def read_back_frame(self):
+        self.render_stream.wait_stream(wp.get_stream())
+        wp.copy(self.render_state.particle_q, self.state.particle_q, stream=self.render_stream)
+        wp.copy(self.render_time, self.sim_time_dev, stream=self.render_stream)
+        self.render_stream.record_event(self.render_event)
+        # the next frame must not overwrite the positions before they are copied
+        wp.get_stream().wait_event(self.render_event)
 
     def advance_frame(self):
-        with wp.ScopedTimer("step", print=False, dict=self.profiler):
-            if self.use_cuda_graph:
-                wp.capture_launch(self.cuda_graph)
-            else:
-                self.integrate_frame_substeps()
-            self.sim_time += self.dt
+        self.step_frame()
+        if self.render_stream is not None:
+            self.read_back_frame()
 
     def run(self):
-        for _ in range(self.num_frames):
+        if self.render_stream is None:
+            for _ in range(self.num_frames):
+                if self.renderer.has_exit:
+                    break
+                self.advance_frame()
+                self.render()
+            return
+
+        # keep one frame in flight: frame N + 1 is launched before the host draws frame N from
+        # its pinned copy, and frame N + 1 is only read back once the host is done with the copy
+        self.advance_frame()
+        for frame in range(self.num_frames):
             if self.renderer.has_exit:
                 break
-            self.advance_frame()
+            has_next_frame = frame + 1 < self.num_frames
+            if has_next_frame:
+                self.step_frame()
             self.render()
+            if has_next_frame:
+                self.read_back_frame()
 
     def render(self):
         if self.renderer is not None:
-            self.renderer.begin_frame(self.sim_time)
-            self.renderer.render(self.state0)
+            if self.render_stream is not None:
+                # only wait for the readback, not for the frame being simulated
+                wp.synchronize_event(self.render_event)
+                self.renderer.begin_frame(float(self.render_time.numpy()[0]))
+                self.render_state.body_q = self.state.body_q
+                # keep the renderer's device work off the simulation stream
+                with wp.ScopedStream(self.render_stream, sync_enter=False):
+                    self.renderer.render(self.render_state)
+            else:
+                self.renderer.begin_frame(float(self.sim_time_dev.numpy()[0]))
+                self.renderer.render(self.state)
             self.renderer.end_frame()
 
 
@@ -171,12 +263,17 @@ if __name__ == "__main__":
         help="Path to the output USD file.",
     )
     parser.add_argument("--num_frames", type=int, default=3000, help="Total number of frames.")
+    parser.add_argument("--profile", action="store_true", help="Record the simulation time of each frame.")
 
     args = parser.parse_known_args()[0]
 
     with wp.ScopedDevice(args.device):
-        example = Example(stage_path=args.stage_path, num_frames=args.num_frames)
+        example = Example(stage_path=args.stage_path, num_frames=args.num_frames, enable_profiling=args.profile)
         example.run()
 
+        if example.enable_profiling:
+            frame_times = example.profiler["step"]
+            print(f"\nAverage frame sim time: {sum(frame_times) / len(frame_times):.2f} ms")
+
         if example.renderer:
             example.renderer.save()
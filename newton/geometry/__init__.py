@@ -17,6 +17,7 @@ import warp as wp
 
 from .flags import (
     PARTICLE_FLAG_ACTIVE,
+    PARTICLE_FLAG_ACTIVE_MASK,
     SHAPE_FLAG_COLLIDE_PARTICLES,
     SHAPE_FLAG_COLLIDE_SHAPES,
     SHAPE_FLAG_VISIBLE,
@@ -87,6 +88,7 @@ __all__ = [
     "GEO_SDF",
     "GEO_SPHERE",
     "PARTICLE_FLAG_ACTIVE",
+    "PARTICLE_FLAG_ACTIVE_MASK",
     "SDF",
     "SHAPE_FLAG_COLLIDE_PARTICLES",
     "SHAPE_FLAG_COLLIDE_SHAPES",
@@ -19,6 +19,9 @@ import warp as wp
 PARTICLE_FLAG_ACTIVE = wp.constant(wp.uint32(1 << 0))
 """Indicates that the particle is active."""
 
+PARTICLE_FLAG_ACTIVE_MASK = ~int(PARTICLE_FLAG_ACTIVE) & 0xFFFFFFFF
+"""Plain integer mask that clears :data:`PARTICLE_FLAG_ACTIVE` when and-ed with host-side particle flags."""
+
 # Shape flags
 SHAPE_FLAG_VISIBLE = wp.constant(wp.uint32(1 << 0))
 """Indicates that the shape is visible."""
@@ -31,6 +34,7 @@ SHAPE_FLAG_COLLIDE_PARTICLES = wp.constant(wp.uint32(1 << 2))
 
 __all__ = [
     "PARTICLE_FLAG_ACTIVE",
+    "PARTICLE_FLAG_ACTIVE_MASK",
     "SHAPE_FLAG_COLLIDE_PARTICLES",
     "SHAPE_FLAG_COLLIDE_SHAPES",
     "SHAPE_FLAG_VISIBLE",
@@ -256,6 +256,63 @@ def color_graph(
     return color_groups
 
 
+def construct_element_graph_edges(element_indices):
+    """
+    Construct the conflict graph of mesh elements, e.g. triangles or bending edges. Each node of the returned graph is an
+    element and two elements are connected if they share a vertex. Negative vertex indices are ignored.
+    It returns an `np.array` of shape (number_graph_edges, 2).
+
+    Args:
+        element_indices: An array of shape (number_elements, vertices_per_element) with the vertex indices of each element
+    """
+    element_indices = np.asarray(element_indices).reshape(len(element_indices), -1)
+
+    elements, columns = np.nonzero(element_indices >= 0)
+    vertices = element_indices[elements, columns]
+
+    # group the elements by the vertex they reference
+    order = np.argsort(vertices, kind="stable")
+    vertices = vertices[order]
+    elements = elements[order]
+    _, group_starts, group_sizes = np.unique(vertices, return_index=True, return_counts=True)
+
+    # connect all pairs of elements within a group, processing groups of equal size together
+    graph_edges = [np.empty((0, 2), dtype=np.int32)]
+    for size in np.unique(group_sizes):
+        if size < 2:
+            continue
+        starts = group_starts[group_sizes == size]
+        groups = elements[starts[:, None] + np.arange(size)[None, :]]
+        rows, cols = np.triu_indices(size, k=1)
+        graph_edges.append(np.stack((groups[:, rows].reshape(-1), groups[:, cols].reshape(-1)), axis=-1))
+
+    graph_edges = np.sort(np.concatenate(graph_edges), axis=1)
+    return np.unique(graph_edges, axis=0).astype(np.int32)
+
+
+def color_mesh_elements(
+    element_indices,
+    balance_colors=True,
+    target_max_min_color_ratio=1.1,
+    algorithm: ColoringAlgorithm = ColoringAlgorithm.MCS,
+):
+    """
+    A function that generates coloring for mesh elements, e.g. triangles or bending edges, such that no two elements of
+    the same color share a vertex. Forces of the elements within one color can therefore be accumulated without atomics.
+    It returns a list of `np.array` with `dtype`=`int`. The length of the list is the number of colors
+    and each `np.array` contains the indices of elements with this color.
+
+    Args:
+        element_indices: An array of shape (number_elements, vertices_per_element), e.g. `sim.Model`'s `tri_indices` or `edge_indices`
+        balance_colors: the parameter passed to `color_graph`, see `color_graph`'s document
+        target_max_min_color_ratio: the parameter passed to `color_graph`, see `color_graph`'s document
+        algorithm: the parameter passed to `color_graph`, see `color_graph`'s document
+    """
+    graph_edge_indices = wp.array(construct_element_graph_edges(element_indices), dtype=int, device="cpu")
+
+    return color_graph(len(element_indices), graph_edge_indices, balance_colors, target_max_min_color_ratio, algorithm)
+
+
 def plot_graph(vertices, edges, edge_labels=None):
     """
     Plots a graph using matplotlib and networkx.
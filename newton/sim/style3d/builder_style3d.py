@@ -168,12 +168,13 @@ class Style3DModelBuilder(ModelBuilder):
 
         """
 
-        indices = np.array(panel_indices).reshape(-1, 3)
+        indices = np.asarray(panel_indices).reshape(-1, 3)
+        panel_verts = np.asarray(panel_verts)
 
         # compute basis for 2D rest pose
-        p = np.array(panel_verts)[indices[:, 0]]
-        q = np.array(panel_verts)[indices[:, 1]]
-        r = np.array(panel_verts)[indices[:, 2]]
+        p = panel_verts[indices[:, 0]]
+        q = panel_verts[indices[:, 1]]
+        r = panel_verts[indices[:, 2]]
 
         qp = q - p
         rp = r - p
@@ -269,8 +270,8 @@ class Style3DModelBuilder(ModelBuilder):
         """
 
         # prepare panel edge data
-        panel_tris = np.array(panel_indices).reshape(-1, 3)
-        panel_pos2d = np.array(panel_verts).reshape(-1, 2)
+        panel_tris = np.asarray(panel_indices).reshape(-1, 3)
+        panel_pos2d = np.asarray(panel_verts).reshape(-1, 2)
         panel_tris_f0 = panel_tris[f0]
         panel_tris_f1 = panel_tris[f1]
 
@@ -498,10 +499,10 @@ class Style3DModelBuilder(ModelBuilder):
         vel: Vec3,
         scale: float,
         density: float,
-        indices: list[int],
-        vertices: list[Vec3],
-        panel_verts: list[Vec2],
-        panel_indices: list[int] | None = None,
+        indices: list[int] | np.ndarray,
+        vertices: list[Vec3] | np.ndarray,
+        panel_verts: list[Vec2] | np.ndarray,
+        panel_indices: list[int] | np.ndarray | None = None,
         tri_aniso_ke: Vec3 | None = None,
         edge_aniso_ke: Vec3 | None = None,
         tri_ka: float | None = None,
@@ -523,11 +524,11 @@ class Style3DModelBuilder(ModelBuilder):
             pos: The position of the cloth in world space
             rot: The orientation of the cloth in world space
             vel: The velocity of the cloth in world space
-            vertices: A list of vertex positions
-            indices: A list of triangle indices, 3 entries per-face
+            vertices: A list or array of vertex positions
+            indices: A list or array of triangle indices, 3 entries per-face
             density: The density per-area of the mesh
-            panel_indices: A list of triangle indices, 3 entries per-face, passes None will use indices as panel_indices
-            panel_verts: A list of vertex 2D positions for panel-based cloth simulation.
+            panel_indices: A list or array of triangle indices, 3 entries per-face, passes None will use indices as panel_indices
+            panel_verts: A list or array of vertex 2D positions for panel-based cloth simulation.
             particle_radius: The particle_radius which controls particle based collisions.
             tri_aniso_ke: anisotropic stretch stiffness (weft, warp, shear) for panel-based cloth simulation.
             edge_aniso_ke: anisotropic bend stiffness (weft, warp, shear) for panel-based cloth simulation.
@@ -547,8 +548,14 @@ class Style3DModelBuilder(ModelBuilder):
         particle_radius = particle_radius if particle_radius is not None else self.default_particle_radius
         panel_verts = panel_verts if panel_verts is not None else []
 
+        # accept lists or arrays, converting once here so that the helpers below index without copies
+        vertices = np.asarray(vertices)
+        indices = np.asarray(indices)
+        panel_verts = np.asarray(panel_verts)
         if panel_indices is None:
             panel_indices = indices
+        else:
+            panel_indices = np.asarray(panel_indices)
 
         num_verts = int(len(vertices))
         num_tris = int(len(indices) / 3)
@@ -562,13 +569,13 @@ class Style3DModelBuilder(ModelBuilder):
         use_panel_mode = num_vert == num_vert2d
         if use_panel_mode:
             # use panel_verts to init particles for computing right panel-based anisotropic attributes, will reset with vertices at the end
-            verts_2d_np = np.array(panel_verts) * scale
+            verts_2d_np = panel_verts * scale
             verts_3d_np = np.hstack([verts_2d_np, np.zeros((len(panel_verts), 1))])
             self.add_particles(
                 verts_3d_np.tolist(), [vel] * num_verts, mass=[0.0] * num_verts, radius=[particle_radius] * num_verts
             )
         else:
-            vertices_np = np.array(vertices) * scale
+            vertices_np = vertices * scale
             rot_mat_np = np.array(wp.quat_to_matrix(rot), dtype=np.float32).reshape(3, 3)
             verts_3d_np = np.dot(vertices_np, rot_mat_np.T) + pos
             self.add_particles(
@@ -576,7 +583,7 @@ class Style3DModelBuilder(ModelBuilder):
             )
 
         # triangles
-        inds = start_vertex + np.array(indices)
+        inds = start_vertex + indices
         inds = inds.reshape(-1, 3)
         tri_aniso_kes = [tri_aniso_ke] * num_tris if tri_aniso_ke is not None else None
         self.add_aniso_triangles(
@@ -639,7 +646,7 @@ class Style3DModelBuilder(ModelBuilder):
 
         if use_panel_mode:
             # reset particle with vertices
-            vertices_np = np.array(vertices) * scale
+            vertices_np = vertices * scale
             rot_mat = np.array(wp.quat_to_matrix(rot), dtype=np.float32).reshape(3, 3)
             verts_3d_np = np.dot(vertices_np, rot_mat.T) + pos
             self.particle_q[start_vertex : start_vertex + num_vert] = verts_3d_np.tolist()
@@ -666,7 +673,9 @@ class Style3DModelBuilder(ModelBuilder):
         for spring in sew_springs:
             self.add_spring(spring[0], spring[1], self.default_spring_ke, self.default_spring_kd, control=0.0)
 
-    def finalize(self, device: Devicelike | None = None, requires_grad: bool = False) -> Style3DModel:
+    def finalize(
+        self, device: Devicelike | None = None, requires_grad: bool = False, param_dtype: type = wp.float32
+    ) -> Style3DModel:
         """Convert this builder object to a concrete model for simulation.
 
         After building simulation elements this method should be called to transfer
@@ -675,6 +684,9 @@ class Style3DModelBuilder(ModelBuilder):
         Args:
             device: The simulation device to use, e.g.: 'cpu', 'cuda'
             requires_grad: Whether to enable gradient computation for the model
+            param_dtype: Scalar type used to store the anisotropic stretch stiffness and the bending cotangents,
+                e.g. ``wp.float16`` to halve the parameter memory traffic of the solver kernels. The rest areas
+                are small and always stored as float32.
 
         Returns:
 
@@ -684,9 +696,16 @@ class Style3DModelBuilder(ModelBuilder):
         model = super().finalize(device=device, requires_grad=requires_grad)
         style3d_model = Style3DModel.from_model(model)
 
+        if param_dtype is wp.float32:
+            vec3_dtype, vec4_dtype = wp.vec3, wp.vec4
+        else:
+            vec3_dtype, vec4_dtype = wp.types.vector(3, param_dtype), wp.types.vector(4, param_dtype)
+
         with wp.ScopedDevice(device):
-            style3d_model.tri_aniso_ke = wp.array(self.tri_aniso_ke, dtype=wp.vec3, requires_grad=requires_grad)
+            style3d_model.tri_aniso_ke = wp.array(self.tri_aniso_ke, dtype=vec3_dtype, requires_grad=requires_grad)
             style3d_model.edge_rest_area = wp.array(self.edge_rest_area, dtype=wp.float32, requires_grad=requires_grad)
-            style3d_model.edge_bending_cot = wp.array(self.edge_bending_cot, dtype=wp.vec4, requires_grad=requires_grad)
+            style3d_model.edge_bending_cot = wp.array(
+                self.edge_bending_cot, dtype=vec4_dtype, requires_grad=requires_grad
+            )
 
         return style3d_model
@@ -39,11 +39,11 @@ class Style3DModel(Model):
         """
         super().__init__(device=device)
         self.tri_aniso_ke = None
-        """Triangle element aniso stretch stiffness(weft, warp, shear), shape [tri_count, 3], float."""
+        """Triangle element aniso stretch stiffness(weft, warp, shear), shape [tri_count, 3], float (or the builder's ``param_dtype``)."""
         self.edge_rest_area = None
         """Bending edge area, sum area of adjacent two triangles, shape [edge_count], float."""
         self.edge_bending_cot = None
-        """Bending edge cotangents, shape [edge_count, 4], float."""
+        """Bending edge cotangents, shape [edge_count, 4], float (or the builder's ``param_dtype``)."""
 
     @classmethod
     def from_model(cls, model: Model):
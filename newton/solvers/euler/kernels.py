@@ -33,6 +33,24 @@ from newton.sim import (
 )
 
 
+@wp.func
+def spring_force(xi: wp.vec3, xj: wp.vec3, vi: wp.vec3, vj: wp.vec3, ke: float, kd: float, rest: float):
+    xij = xi - xj
+    vij = vi - vj
+
+    l = wp.length(xij)
+    l_inv = 1.0 / l
+
+    # normalized spring direction
+    dir = xij * l_inv
+
+    c = l - rest
+    dcdt = wp.dot(dir, vij)
+
+    # damping based on relative velocity
+    return dir * (ke * c + kd * dcdt)
+
+
 @wp.kernel
 def eval_springs(
     x: wp.array(dtype=wp.vec3),
@@ -55,69 +73,66 @@ def eval_springs(
     kd = spring_damping[tid]
     rest = spring_rest_lengths[tid]
 
-    xi = x[i]
-    xj = x[j]
-
-    vi = v[i]
-    vj = v[j]
-
-    xij = xi - xj
-    vij = vi - vj
-
-    l = wp.length(xij)
-    l_inv = 1.0 / l
-
-    # normalized spring direction
-    dir = xij * l_inv
-
-    c = l - rest
-    dcdt = wp.dot(dir, vij)
-
-    # damping based on relative velocity
-    fs = dir * (ke * c + kd * dcdt)
+    fs = spring_force(x[i], x[j], v[i], v[j], ke, kd, rest)
 
     wp.atomic_sub(f, i, fs)
     wp.atomic_add(f, j, fs)
 
 
 @wp.kernel
-def eval_triangles(
+def eval_springs_slots(
     x: wp.array(dtype=wp.vec3),
     v: wp.array(dtype=wp.vec3),
-    indices: wp.array2d(dtype=int),
-    pose: wp.array(dtype=wp.mat22),
-    activation: wp.array(dtype=float),
-    materials: wp.array2d(dtype=float),
-    f: wp.array(dtype=wp.vec3),
+    spring_indices: wp.array(dtype=int),
+    spring_rest_lengths: wp.array(dtype=float),
+    spring_stiffness: wp.array(dtype=float),
+    spring_damping: wp.array(dtype=float),
+    # outputs
+    slot_f: wp.array(dtype=wp.vec3),
 ):
+    # same as eval_springs but writes each endpoint force to its own slot instead of scattering atomically
     tid = wp.tid()
 
-    k_mu = materials[tid, 0]
-    k_lambda = materials[tid, 1]
-    k_damp = materials[tid, 2]
-    k_drag = materials[tid, 3]
-    k_lift = materials[tid, 4]
+    i = spring_indices[tid * 2 + 0]
+    j = spring_indices[tid * 2 + 1]
 
-    i = indices[tid, 0]
-    j = indices[tid, 1]
-    k = indices[tid, 2]
+    if i == -1 or j == -1:
+        slot_f[tid * 2 + 0] = wp.vec3(0.0)
+        slot_f[tid * 2 + 1] = wp.vec3(0.0)
+        return
 
-    x0 = x[i]  # point zero
-    x1 = x[j]  # point one
-    x2 = x[k]  # point two
+    ke = spring_stiffness[tid]
+    kd = spring_damping[tid]
+    rest = spring_rest_lengths[tid]
+
+    fs = spring_force(x[i], x[j], v[i], v[j], ke, kd, rest)
+
+    slot_f[tid * 2 + 0] = -fs
+    slot_f[tid * 2 + 1] = fs
 
-    v0 = v[i]  # vel zero
-    v1 = v[j]  # vel one
-    v2 = v[k]  # vel two
 
+@wp.func
+def triangle_force(
+    x0: wp.vec3,
+    x1: wp.vec3,
+    x2: wp.vec3,
+    v0: wp.vec3,
+    v1: wp.vec3,
+    v2: wp.vec3,
+    Dm: wp.mat22,
+    act: float,
+    k_mu: float,
+    k_lambda: float,
+    k_damp: float,
+    k_drag: float,
+    k_lift: float,
+):
     x10 = x1 - x0  # barycentric coordinates (centered at p)
     x20 = x2 - x0
 
     v10 = v1 - v0
     v20 = v2 - v0
 
-    Dm = pose[tid]
-
     inv_rest_area = wp.determinant(Dm) * 2.0  # 1 / det(A) = det(A^-1)
     rest_area = 1.0 / inv_rest_area
 
@@ -183,9 +198,6 @@ def eval_triangles(
     n = wp.cross(x10, x20)
     area = wp.length(n) * 0.5
 
-    # actuation
-    act = activation[tid]
-
     # J-alpha
     c = area * inv_rest_area - alpha + act
 
@@ -219,12 +231,127 @@ def eval_triangles(
     f1 = f1 + f_drag + f_lift
     f2 = f2 + f_drag + f_lift
 
+    # forces on the first vertex and (negated) on the second and third vertex
+    return f0, f1, f2
+
+
+@wp.kernel
+def eval_triangles(
+    x: wp.array(dtype=wp.vec3),
+    v: wp.array(dtype=wp.vec3),
+    indices: wp.array2d(dtype=int),
+    pose: wp.array(dtype=wp.mat22),
+    activation: wp.array(dtype=float),
+    materials: wp.array2d(dtype=float),
+    f: wp.array(dtype=wp.vec3),
+):
+    tid = wp.tid()
+
+    k_mu = materials[tid, 0]
+    k_lambda = materials[tid, 1]
+    k_damp = materials[tid, 2]
+    k_drag = materials[tid, 3]
+    k_lift = materials[tid, 4]
+
+    i = indices[tid, 0]
+    j = indices[tid, 1]
+    k = indices[tid, 2]
+
+    f0, f1, f2 = triangle_force(
+        x[i], x[j], x[k], v[i], v[j], v[k], pose[tid], activation[tid], k_mu, k_lambda, k_damp, k_drag, k_lift
+    )
+
     # apply forces
     wp.atomic_add(f, i, f0)
     wp.atomic_sub(f, j, f1)
     wp.atomic_sub(f, k, f2)
 
 
+@wp.kernel
+def eval_triangles_slots(
+    x: wp.array(dtype=wp.vec3),
+    v: wp.array(dtype=wp.vec3),
+    indices: wp.array2d(dtype=int),
+    pose: wp.array(dtype=wp.mat22),
+    activation: wp.array(dtype=float),
+    materials: wp.array2d(dtype=float),
+    slot_start: int,
+    # outputs
+    slot_f: wp.array(dtype=wp.vec3),
+):
+    # same as eval_triangles but writes each vertex force to its own slot instead of scattering atomically
+    tid = wp.tid()
+
+    k_mu = materials[tid, 0]
+    k_lambda = materials[tid, 1]
+    k_damp = materials[tid, 2]
+    k_drag = materials[tid, 3]
+    k_lift = materials[tid, 4]
+
+    i = indices[tid, 0]
+    j = indices[tid, 1]
+    k = indices[tid, 2]
+
+    f0, f1, f2 = triangle_force(
+        x[i], x[j], x[k], v[i], v[j], v[k], pose[tid], activation[tid], k_mu, k_lambda, k_damp, k_drag, k_lift
+    )
+
+    slot = slot_start + tid * 3
+    slot_f[slot + 0] = f0
+    slot_f[slot + 1] = -f1
+    slot_f[slot + 2] = -f2
+
+
+@wp.kernel
+def eval_triangles_colored(
+    x: wp.array(dtype=wp.vec3),
+    v: wp.array(dtype=wp.vec3),
+    indices: wp.array2d(dtype=int),
+    pose: wp.array(dtype=wp.mat22),
+    activation: wp.array(dtype=float),
+    materials: wp.array2d(dtype=float),
+    color_group: wp.array(dtype=int),
+    f: wp.array(dtype=wp.vec3),
+):
+    # same as eval_triangles for the triangles of one color, which share no particles so forces are added without atomics
+    tid = color_group[wp.tid()]
+
+    k_mu = materials[tid, 0]
+    k_lambda = materials[tid, 1]
+    k_damp = materials[tid, 2]
+    k_drag = materials[tid, 3]
+    k_lift = materials[tid, 4]
+
+    i = indices[tid, 0]
+    j = indices[tid, 1]
+    k = indices[tid, 2]
+
+    f0, f1, f2 = triangle_force(
+        x[i], x[j], x[k], v[i], v[j], v[k], pose[tid], activation[tid], k_mu, k_lambda, k_damp, k_drag, k_lift
+    )
+
+    f[i] = f[i] + f0
+    f[j] = f[j] - f1
+    f[k] = f[k] - f2
+
+
+@wp.kernel
+def gather_particle_forces(
+    particle_slot_offsets: wp.array(dtype=int),
+    particle_slots: wp.array(dtype=int),
+    slot_f: wp.array(dtype=wp.vec3),
+    # outputs
+    f: wp.array(dtype=wp.vec3),
+):
+    tid = wp.tid()
+
+    f_sum = wp.vec3(0.0)
+    for k in range(particle_slot_offsets[tid], particle_slot_offsets[tid + 1]):
+        f_sum += slot_f[particle_slots[k]]
+
+    f[tid] = f[tid] + f_sum
+
+
 @wp.kernel
 def eval_triangles_contact(
     # idx : wp.array(dtype=int), # list of indices for colliding particles
@@ -402,41 +529,22 @@ def eval_triangles_body_contacts(
     wp.atomic_add(tri_f, k, f_total * bary[2])
 
 
-@wp.kernel
-def eval_bending(
-    x: wp.array(dtype=wp.vec3),
-    v: wp.array(dtype=wp.vec3),
-    indices: wp.array2d(dtype=int),
-    rest: wp.array(dtype=float),
-    bending_properties: wp.array2d(dtype=float),
-    f: wp.array(dtype=wp.vec3),
+@wp.func
+def bending_force(
+    x1: wp.vec3,
+    x2: wp.vec3,
+    x3: wp.vec3,
+    x4: wp.vec3,
+    v1: wp.vec3,
+    v2: wp.vec3,
+    v3: wp.vec3,
+    v4: wp.vec3,
+    ke: float,
+    kd: float,
+    rest_angle: float,
 ):
-    tid = wp.tid()
     eps = 1.0e-6
 
-    ke = bending_properties[tid, 0]
-    kd = bending_properties[tid, 1]
-
-    i = indices[tid, 0]
-    j = indices[tid, 1]
-    k = indices[tid, 2]
-    l = indices[tid, 3]
-
-    if i == -1 or j == -1 or k == -1 or l == -1:
-        return
-
-    rest_angle = rest[tid]
-
-    x1 = x[i]
-    x2 = x[j]
-    x3 = x[k]
-    x4 = x[l]
-
-    v1 = v[i]
-    v2 = v[j]
-    v3 = v[k]
-    v4 = v[l]
-
     n1 = wp.cross(x3 - x1, x4 - x1)  # normal to face 1
     n2 = wp.cross(x4 - x2, x3 - x2)  # normal to face 2
     e = x4 - x3
@@ -447,7 +555,7 @@ def eval_bending(
 
     # Check for degenerate cases
     if n1_length < eps or n2_length < eps or e_length < eps:
-        return
+        return wp.vec3(0.0), wp.vec3(0.0), wp.vec3(0.0), wp.vec3(0.0)
 
     n1 = n1 / n1_length
     n2 = n2 / n2_length
@@ -471,10 +579,69 @@ def eval_bending(
     # total force, proportional to edge length
     f_total = -e_length * (f_elastic + f_damp)
 
-    wp.atomic_add(f, i, d1 * f_total)
-    wp.atomic_add(f, j, d2 * f_total)
-    wp.atomic_add(f, k, d3 * f_total)
-    wp.atomic_add(f, l, d4 * f_total)
+    return d1 * f_total, d2 * f_total, d3 * f_total, d4 * f_total
+
+
+@wp.kernel
+def eval_bending(
+    x: wp.array(dtype=wp.vec3),
+    v: wp.array(dtype=wp.vec3),
+    indices: wp.array2d(dtype=int),
+    rest: wp.array(dtype=float),
+    bending_properties: wp.array2d(dtype=float),
+    f: wp.array(dtype=wp.vec3),
+):
+    tid = wp.tid()
+
+    ke = bending_properties[tid, 0]
+    kd = bending_properties[tid, 1]
+
+    i = indices[tid, 0]
+    j = indices[tid, 1]
+    k = indices[tid, 2]
+    l = indices[tid, 3]
+
+    if i == -1 or j == -1 or k == -1 or l == -1:
+        return
+
+    f1, f2, f3, f4 = bending_force(x[i], x[j], x[k], x[l], v[i], v[j], v[k], v[l], ke, kd, rest[tid])
+
+    wp.atomic_add(f, i, f1)
+    wp.atomic_add(f, j, f2)
+    wp.atomic_add(f, k, f3)
+    wp.atomic_add(f, l, f4)
+
+
+@wp.kernel
+def eval_bending_colored(
+    x: wp.array(dtype=wp.vec3),
+    v: wp.array(dtype=wp.vec3),
+    indices: wp.array2d(dtype=int),
+    rest: wp.array(dtype=float),
+    bending_properties: wp.array2d(dtype=float),
+    color_group: wp.array(dtype=int),
+    f: wp.array(dtype=wp.vec3),
+):
+    # same as eval_bending for the edges of one color, which share no particles so forces are added without atomics
+    eid = color_group[wp.tid()]
+
+    ke = bending_properties[eid, 0]
+    kd = bending_properties[eid, 1]
+
+    i = indices[eid, 0]
+    j = indices[eid, 1]
+    k = indices[eid, 2]
+    l = indices[eid, 3]
+
+    if i == -1 or j == -1 or k == -1 or l == -1:
+        return
+
+    f1, f2, f3, f4 = bending_force(x[i], x[j], x[k], x[l], v[i], v[j], v[k], v[l], ke, kd, rest[eid])
+
+    f[i] = f[i] + f1
+    f[j] = f[j] + f2
+    f[k] = f[k] + f3
+    f[l] = f[l] + f4
 
 
 @wp.kernel
@@ -1572,6 +1739,95 @@ def eval_triangle_forces(model: Model, state: State, control: Control, particle_
         )
 
 
+def eval_spring_slot_forces(model: Model, state: State, slot_f: wp.array):
+    if model.spring_count:
+        wp.launch(
+            kernel=eval_springs_slots,
+            dim=model.spring_count,
+            inputs=[
+                state.particle_q,
+                state.particle_qd,
+                model.spring_indices,
+                model.spring_rest_length,
+                model.spring_stiffness,
+                model.spring_damping,
+            ],
+            outputs=[slot_f],
+            device=model.device,
+        )
+
+
+def eval_triangle_slot_forces(model: Model, state: State, control: Control, slot_f: wp.array, slot_start: int):
+    if model.tri_count:
+        wp.launch(
+            kernel=eval_triangles_slots,
+            dim=model.tri_count,
+            inputs=[
+                state.particle_q,
+                state.particle_qd,
+                model.tri_indices,
+                model.tri_poses,
+                control.tri_activations,
+                model.tri_materials,
+                slot_start,
+            ],
+            outputs=[slot_f],
+            device=model.device,
+        )
+
+
+def eval_colored_triangle_forces(
+    model: Model, state: State, control: Control, tri_color_groups: list[wp.array], particle_f: wp.array
+):
+    for color_group in tri_color_groups:
+        wp.launch(
+            kernel=eval_triangles_colored,
+            dim=color_group.size,
+            inputs=[
+                state.particle_q,
+                state.particle_qd,
+                model.tri_indices,
+                model.tri_poses,
+                control.tri_activations,
+                model.tri_materials,
+                color_group,
+            ],
+            outputs=[particle_f],
+            device=model.device,
+        )
+
+
+def eval_colored_bending_forces(model: Model, state: State, edge_color_groups: list[wp.array], particle_f: wp.array):
+    for color_group in edge_color_groups:
+        wp.launch(
+            kernel=eval_bending_colored,
+            dim=color_group.size,
+            inputs=[
+                state.particle_q,
+                state.particle_qd,
+                model.edge_indices,
+                model.edge_rest_angle,
+                model.edge_bending_properties,
+                color_group,
+            ],
+            outputs=[particle_f],
+            device=model.device,
+        )
+
+
+def eval_gathered_particle_forces(
+    model: Model, particle_slot_offsets: wp.array, particle_slots: wp.array, slot_f: wp.array, particle_f: wp.array
+):
+    if model.particle_count:
+        wp.launch(
+            kernel=gather_particle_forces,
+            dim=model.particle_count,
+            inputs=[particle_slot_offsets, particle_slots, slot_f],
+            outputs=[particle_f],
+            device=model.device,
+        )
+
+
 def eval_triangle_contact_forces(model: Model, state: State, particle_f: wp.array):
     if model.tri_count and model.particle_count:
         wp.launch(
@@ -18,6 +18,8 @@ import warp as wp
 from newton.geometry import PARTICLE_FLAG_ACTIVE
 from newton.sim import Model, State
 
+from ..solver import integrate_particle
+
 
 @wp.func
 def particle_force(n: wp.vec3, v: wp.vec3, c: float, k_n: float, k_d: float, k_f: float, k_mu: float):
@@ -43,6 +45,46 @@ def particle_force(n: wp.vec3, v: wp.vec3, c: float, k_n: float, k_d: float, k_f
     return -n * fn - vt * ft
 
 
+@wp.func
+def eval_particle_contact_force(
+    grid: wp.uint64,
+    i: int,
+    x: wp.vec3,
+    v: wp.vec3,
+    radius: float,
+    particle_x: wp.array(dtype=wp.vec3),
+    particle_v: wp.array(dtype=wp.vec3),
+    particle_radius: wp.array(dtype=float),
+    particle_flags: wp.array(dtype=wp.uint32),
+    k_contact: float,
+    k_damp: float,
+    k_friction: float,
+    k_mu: float,
+    k_cohesion: float,
+    max_radius: float,
+):
+    f = wp.vec3()
+
+    # particle contact
+    query = wp.hash_grid_query(grid, x, radius + max_radius + k_cohesion)
+    index = int(0)
+
+    while wp.hash_grid_query_next(query, index):
+        if (particle_flags[index] & PARTICLE_FLAG_ACTIVE) != 0 and index != i:
+            # compute distance to point
+            n = x - particle_x[index]
+            d = wp.length(n)
+            err = d - radius - particle_radius[index]
+
+            if err <= k_cohesion:
+                n = n / d
+                vrel = v - particle_v[index]
+
+                f = f + particle_force(n, vrel, err, k_contact, k_damp, k_friction, k_mu)
+
+    return f
+
+
 @wp.kernel
 def eval_particle_forces_kernel(
     grid: wp.uint64,
@@ -69,38 +111,95 @@ def eval_particle_forces_kernel(
     if (particle_flags[i] & PARTICLE_FLAG_ACTIVE) == 0:
         return
 
-    x = particle_x[i]
-    v = particle_v[i]
-    radius = particle_radius[i]
+    particle_f[i] = eval_particle_contact_force(
+        grid,
+        i,
+        particle_x[i],
+        particle_v[i],
+        particle_radius[i],
+        particle_x,
+        particle_v,
+        particle_radius,
+        particle_flags,
+        k_contact,
+        k_damp,
+        k_friction,
+        k_mu,
+        k_cohesion,
+        max_radius,
+    )
 
-    f = wp.vec3()
 
-    # particle contact
-    query = wp.hash_grid_query(grid, x, radius + max_radius + k_cohesion)
-    index = int(0)
+@wp.kernel
+def eval_particle_forces_and_integrate_kernel(
+    grid: wp.uint64,
+    particle_x: wp.array(dtype=wp.vec3),
+    particle_v: wp.array(dtype=wp.vec3),
+    particle_radius: wp.array(dtype=float),
+    particle_flags: wp.array(dtype=wp.uint32),
+    particle_inv_mass: wp.array(dtype=float),
+    k_contact: float,
+    k_damp: float,
+    k_friction: float,
+    k_mu: float,
+    k_cohesion: float,
+    max_radius: float,
+    gravity: wp.vec3,
+    dt: float,
+    v_max: float,
+    # outputs
+    particle_f: wp.array(dtype=wp.vec3),
+    particle_x_new: wp.array(dtype=wp.vec3),
+    particle_v_new: wp.array(dtype=wp.vec3),
+):
+    tid = wp.tid()
 
-    count = int(0)
+    # order threads by cell
+    i = wp.hash_grid_point_id(grid, tid)
+    grid_built = i != -1
+    if not grid_built:
+        # hash grid has not been built yet, integrate the previously accumulated forces only
+        i = tid
+    if (particle_flags[i] & PARTICLE_FLAG_ACTIVE) == 0:
+        return
 
-    while wp.hash_grid_query_next(query, index):
-        if (particle_flags[index] & PARTICLE_FLAG_ACTIVE) != 0 and index != i:
-            # compute distance to point
-            n = x - particle_x[index]
-            d = wp.length(n)
-            err = d - radius - particle_radius[index]
+    x = particle_x[i]
+    v = particle_v[i]
 
-            count += 1
+    if grid_built:
+        f = eval_particle_contact_force(
+            grid,
+            i,
+            x,
+            v,
+            particle_radius[i],
+            particle_x,
+            particle_v,
+            particle_radius,
+            particle_flags,
+            k_contact,
+            k_damp,
+            k_friction,
+            k_mu,
+            k_cohesion,
+            max_radius,
+        )
+        particle_f[i] = f
+    else:
+        f = particle_f[i]
 
-            if err <= k_cohesion:
-                n = n / d
-                vrel = v - particle_v[index]
+    x1, v1 = integrate_particle(x, v, f, particle_inv_mass[i], gravity, dt, v_max)
 
-                f = f + particle_force(n, vrel, err, k_contact, k_damp, k_friction, k_mu)
+    particle_x_new[i] = x1
+    particle_v_new[i] = v1
 
-    particle_f[i] = f
+
+def particle_grid_forces_enabled(model: Model) -> bool:
+    return model.particle_count > 1 and model.particle_max_radius > 0.0
 
 
 def eval_particle_forces(model: Model, state: State, forces: wp.array(dtype=wp.vec3)):
-    if model.particle_count > 1 and model.particle_max_radius > 0.0:
+    if particle_grid_forces_enabled(model):
         wp.launch(
             kernel=eval_particle_forces_kernel,
             dim=model.particle_count,
@@ -120,3 +219,33 @@ def eval_particle_forces(model: Model, state: State, forces: wp.array(dtype=wp.v
             outputs=[forces],
             device=model.device,
         )
+
+
+def eval_particle_forces_and_integrate(
+    model: Model, state_in: State, state_out: State, forces: wp.array(dtype=wp.vec3), dt: float
+):
+    # equivalent to eval_particle_forces() followed by SolverBase.integrate_particles(), only valid
+    # when no other stage adds particle forces in between and particle_grid_forces_enabled() holds
+    wp.launch(
+        kernel=eval_particle_forces_and_integrate_kernel,
+        dim=model.particle_count,
+        inputs=[
+            model.particle_grid.id,
+            state_in.particle_q,
+            state_in.particle_qd,
+            model.particle_radius,
+            model.particle_flags,
+            model.particle_inv_mass,
+            model.particle_ke,
+            model.particle_kd,
+            model.particle_kf,
+            model.particle_mu,
+            model.particle_cohesion,
+            model.particle_max_radius,
+            model.gravity,
+            dt,
+            model.particle_max_velocity,
+        ],
+        outputs=[forces, state_out.particle_q, state_out.particle_qd],
+        device=model.device,
+    )
@@ -13,24 +13,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import warp as wp
 
 from newton.core.types import override
 from newton.sim import Contacts, Control, Model, State
+from newton.sim.graph_coloring import color_mesh_elements
 
 from ..solver import SolverBase
 from .kernels import (
     eval_bending_forces,
     eval_body_contact_forces,
     eval_body_joint_forces,
+    eval_colored_bending_forces,
+    eval_colored_triangle_forces,
+    eval_gathered_particle_forces,
     eval_muscle_forces,
     eval_particle_body_contact_forces,
     eval_spring_forces,
+    eval_spring_slot_forces,
     eval_tetrahedral_forces,
     eval_triangle_contact_forces,
     eval_triangle_forces,
+    eval_triangle_slot_forces,
 )
-from .particles import eval_particle_forces
+from .particles import eval_particle_forces, eval_particle_forces_and_integrate, particle_grid_forces_enabled
 
 
 class SemiImplicitSolver(SolverBase):
@@ -66,6 +73,8 @@ class SemiImplicitSolver(SolverBase):
         friction_smoothing: float = 1.0,
         joint_attach_ke: float = 1.0e4,
         joint_attach_kd: float = 1.0e2,
+        gather_forces: bool = False,
+        color_elements: bool = False,
     ):
         """Create a new Euler solver.
 
@@ -75,6 +84,14 @@ class SemiImplicitSolver(SolverBase):
             friction_smoothing (float, optional): Huber norm delta used for friction velocity normalization (see :func:`warp.math.norm_huber`). Defaults to 1.0.
             joint_attach_ke (float, optional): Joint attachment spring stiffness. Defaults to 1.0e4.
             joint_attach_kd (float, optional): Joint attachment spring damping. Defaults to 1.0e2.
+            gather_forces (bool, optional): If True, spring and triangle forces are written to one slot per
+                element vertex and summed per particle in a separate pass instead of being scattered with atomics.
+                This avoids atomic contention on high-valence vertices and makes the accumulation order
+                deterministic, at the cost of one extra kernel launch and O(elements) memory. Defaults to False.
+            color_elements (bool, optional): If True, triangles and bending edges are graph-colored once at
+                construction so that no two elements of a color share a vertex, and their forces are accumulated
+                without atomics by launching one kernel per color. Takes precedence over ``gather_forces`` for
+                triangles. Defaults to False.
         """
         super().__init__(model=model)
         self.angular_damping = angular_damping
@@ -82,6 +99,53 @@ class SemiImplicitSolver(SolverBase):
         self.joint_attach_ke = joint_attach_ke
         self.joint_attach_kd = joint_attach_kd
 
+        # model-derived values reused by every step
+        self._particle_count = model.particle_count
+        self._body_count = model.body_count
+        self._empty_control = model.control(clone_variables=False)
+
+        # element color groups whose forces are accumulated without atomics, one launch per color
+        self.tri_color_groups = None
+        self.edge_color_groups = None
+        if color_elements:
+            if model.tri_count:
+                self.tri_color_groups = self._color_elements(model, model.tri_indices)
+            if model.edge_count:
+                self.edge_color_groups = self._color_elements(model, model.edge_indices)
+
+        # per-particle CSR lists of the spring and triangle force slots gathered into particle_f
+        self.particle_slot_offsets = None
+        self.particle_slots = None
+        self.slot_f = None
+        if gather_forces:
+            self._init_force_slots(model)
+
+    @staticmethod
+    def _color_elements(model: Model, element_indices: wp.array) -> list[wp.array]:
+        # color sizes only affect launch balance, not the accumulated forces
+        color_groups = color_mesh_elements(element_indices.numpy(), balance_colors=False)
+        return [wp.array(group, dtype=int, device=model.device) for group in color_groups]
+
+    def _init_force_slots(self, model: Model):
+        # slots [0, 2 * spring_count) hold spring endpoint forces, followed by 3 slots per triangle
+        slot_particles = []
+        if model.spring_count:
+            slot_particles.append(model.spring_indices.numpy().reshape(-1))
+        if model.tri_count and self.tri_color_groups is None:
+            slot_particles.append(model.tri_indices.numpy().reshape(-1))
+        if not slot_particles:
+            return
+
+        slot_particles = np.concatenate(slot_particles)
+        valid_slots = np.nonzero(slot_particles >= 0)[0]
+        particle_slots = valid_slots[np.argsort(slot_particles[valid_slots], kind="stable")].astype(np.int32)
+        particle_slot_offsets = np.zeros(model.particle_count + 1, dtype=np.int32)
+        particle_slot_offsets[1:] = np.cumsum(np.bincount(slot_particles[valid_slots], minlength=model.particle_count))
+
+        self.particle_slot_offsets = wp.array(particle_slot_offsets, dtype=int, device=model.device)
+        self.particle_slots = wp.array(particle_slots, dtype=int, device=model.device)
+        self.slot_f = wp.zeros(len(slot_particles), dtype=wp.vec3, device=model.device)
+
     @override
     def step(
         self,
@@ -93,53 +157,86 @@ class SemiImplicitSolver(SolverBase):
         dt: float,
     ):
         with wp.ScopedTimer("simulate", False):
-            particle_f = None
-            body_f = None
-
-            if state_in.particle_count:
-                particle_f = state_in.particle_f
-
-            if state_in.body_count:
-                body_f = state_in.body_f
+            # bind state buffers and solver parameters once per step
+            particle_f = state_in.particle_f if self._particle_count else None
+            body_f = state_in.body_f if self._body_count else None
+            friction_smoothing = self.friction_smoothing
+            joint_attach_ke = self.joint_attach_ke
+            joint_attach_kd = self.joint_attach_kd
 
             if control is None:
-                control = model.control(clone_variables=False)
-
-            # damped springs
-            eval_spring_forces(model, state_in, particle_f)
-
-            # triangle elastic and lift/drag forces
-            eval_triangle_forces(model, state_in, control, particle_f)
-
-            # triangle/triangle contacts
-            eval_triangle_contact_forces(model, state_in, particle_f)
-
-            # triangle bending
-            eval_bending_forces(model, state_in, particle_f)
-
-            # tetrahedral FEM
-            eval_tetrahedral_forces(model, state_in, control, particle_f)
-
-            # body joints
-            eval_body_joint_forces(model, state_in, control, body_f, self.joint_attach_ke, self.joint_attach_kd)
-
-            # particle-particle interactions
-            eval_particle_forces(model, state_in, particle_f)
-
-            # body contacts
-            eval_body_contact_forces(model, state_in, contacts, friction_smoothing=self.friction_smoothing)
-
-            # particle shape contact
-            eval_particle_body_contact_forces(
-                model, state_in, contacts, particle_f, body_f, body_f_in_world_frame=False
+                control = self._empty_control
+
+            # particle-particle interactions are fused with the particle integration when they are the
+            # last stage to write particle forces, i.e. when there are no particle-shape contacts
+            fuse_particle_integration = (
+                particle_f is not None
+                and (contacts is None or not contacts.soft_contact_max)
+                and particle_grid_forces_enabled(model)
             )
 
+            # the eval_* helpers already skip empty element sets, additionally skip
+            # the particle and body stage groups entirely when the model has none
+            if particle_f is not None:
+                if self.slot_f is not None:
+                    # damped springs and triangle elastic and lift/drag forces, gathered per particle
+                    eval_spring_slot_forces(model, state_in, self.slot_f)
+                    if self.tri_color_groups is None:
+                        eval_triangle_slot_forces(model, state_in, control, self.slot_f, 2 * model.spring_count)
+                    eval_gathered_particle_forces(
+                        model, self.particle_slot_offsets, self.particle_slots, self.slot_f, particle_f
+                    )
+                else:
+                    # damped springs
+                    eval_spring_forces(model, state_in, particle_f)
+
+                    # triangle elastic and lift/drag forces
+                    if self.tri_color_groups is None:
+                        eval_triangle_forces(model, state_in, control, particle_f)
+
+                if self.tri_color_groups is not None:
+                    # triangle elastic and lift/drag forces, one launch per color
+                    eval_colored_triangle_forces(model, state_in, control, self.tri_color_groups, particle_f)
+
+                # triangle/triangle contacts
+                eval_triangle_contact_forces(model, state_in, particle_f)
+
+                # triangle bending
+                if self.edge_color_groups is not None:
+                    eval_colored_bending_forces(model, state_in, self.edge_color_groups, particle_f)
+                else:
+                    eval_bending_forces(model, state_in, particle_f)
+
+                # tetrahedral FEM
+                eval_tetrahedral_forces(model, state_in, control, particle_f)
+
+                if fuse_particle_integration:
+                    # particle-particle interactions and integration
+                    eval_particle_forces_and_integrate(model, state_in, state_out, particle_f, dt)
+                else:
+                    # particle-particle interactions
+                    eval_particle_forces(model, state_in, particle_f)
+
+                    # particle shape contact
+                    eval_particle_body_contact_forces(
+                        model, state_in, contacts, particle_f, body_f, body_f_in_world_frame=False
+                    )
+
+            if body_f is not None:
+                # body joints
+                eval_body_joint_forces(model, state_in, control, body_f, joint_attach_ke, joint_attach_kd)
+
+                # body contacts
+                eval_body_contact_forces(model, state_in, contacts, friction_smoothing=friction_smoothing)
+
             # muscles
             if False:
                 eval_muscle_forces(model, state_in, control, body_f)
 
-            self.integrate_bodies(model, state_in, state_out, dt, self.angular_damping)
+            if body_f is not None:
+                self.integrate_bodies(model, state_in, state_out, dt, self.angular_damping)
 
-            self.integrate_particles(model, state_in, state_out, dt)
+            if particle_f is not None and not fuse_particle_integration:
+                self.integrate_particles(model, state_in, state_out, dt)
 
             return state_out
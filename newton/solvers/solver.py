@@ -19,6 +19,27 @@ from newton.geometry import PARTICLE_FLAG_ACTIVE
 from newton.sim import Contacts, Control, Model, State
 
 
+@wp.func
+def integrate_particle(
+    x0: wp.vec3,
+    v0: wp.vec3,
+    f0: wp.vec3,
+    inv_mass: float,
+    gravity: wp.vec3,
+    dt: float,
+    v_max: float,
+):
+    # simple semi-implicit Euler. v1 = v0 + a dt, x1 = x0 + v1 dt
+    v1 = v0 + (f0 * inv_mass + gravity * wp.step(-inv_mass)) * dt
+    # enforce velocity limit to prevent instability
+    v1_mag = wp.length(v1)
+    if v1_mag > v_max:
+        v1 *= v_max / v1_mag
+    x1 = x0 + v1 * dt
+
+    return x1, v1
+
+
 @wp.kernel
 def integrate_particles(
     x: wp.array(dtype=wp.vec3),
@@ -36,19 +57,7 @@ def integrate_particles(
     if (particle_flags[tid] & PARTICLE_FLAG_ACTIVE) == 0:
         return
 
-    x0 = x[tid]
-    v0 = v[tid]
-    f0 = f[tid]
-
-    inv_mass = w[tid]
-
-    # simple semi-implicit Euler. v1 = v0 + a dt, x1 = x0 + v1 dt
-    v1 = v0 + (f0 * inv_mass + gravity * wp.step(-inv_mass)) * dt
-    # enforce velocity limit to prevent instability
-    v1_mag = wp.length(v1)
-    if v1_mag > v_max:
-        v1 *= v_max / v1_mag
-    x1 = x0 + v1 * dt
+    x1, v1 = integrate_particle(x[tid], v[tid], f[tid], w[tid], gravity, dt, v_max)
 
     x_new[tid] = x1
     v_new[tid] = v1
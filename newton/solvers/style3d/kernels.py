@@ -14,6 +14,8 @@
 # limitations under the License.
 
 
+from typing import Any
+
 import warp as wp
 
 from newton.geometry import PARTICLE_FLAG_ACTIVE
@@ -33,7 +35,7 @@ def eval_stretch_kernel(
     face_areas: wp.array(dtype=float),
     inv_dms: wp.array(dtype=wp.mat22),
     faces: wp.array(dtype=wp.int32, ndim=2),
-    aniso_ke: wp.array(dtype=wp.vec3),
+    aniso_ke: wp.array(dtype=Any),
     # outputs
     forces: wp.array(dtype=wp.vec3),
 ):
@@ -57,9 +59,11 @@ def eval_stretch_kernel(
     dFu_dx = wp.vec3(-inv_dm[0, 0] - inv_dm[1, 0], inv_dm[0, 0], inv_dm[1, 0])
     dFv_dx = wp.vec3(-inv_dm[0, 1] - inv_dm[1, 1], inv_dm[0, 1], inv_dm[1, 1])
 
-    ku = aniso_ke[fid][0]
-    kv = aniso_ke[fid][1]
-    ks = aniso_ke[fid][2]
+    # stiffness may be stored at reduced precision, compute in float32
+    ke = wp.vec3(aniso_ke[fid])
+    ku = ke[0]
+    kv = ke[1]
+    ks = ke[2]
 
     for i in range(3):
         force = -face_area * (
@@ -74,7 +78,7 @@ def eval_stretch_kernel(
 def eval_bend_kernel(
     pos: wp.array(dtype=wp.vec3),
     edge_rest_area: wp.array(dtype=float),
-    edge_bending_cot: wp.array(dtype=wp.vec4),
+    edge_bending_cot: wp.array(dtype=Any),
     edges: wp.array(dtype=wp.int32, ndim=2),
     edge_bending_properties: wp.array(dtype=float, ndim=2),
     # outputs
@@ -86,11 +90,13 @@ def eval_bend_kernel(
     # reorder as qbend order
     edge = edges[eid]
     edge_stiff = edge_bending_properties[eid][0] / edge_rest_area[eid]
+    # cotangents may be stored at reduced precision, compute in float32
+    cot = wp.vec4(edge_bending_cot[eid])
     bend_weight = wp.vec4(0.0)
-    bend_weight[2] = edge_bending_cot[eid][2] + edge_bending_cot[eid][3]
-    bend_weight[3] = edge_bending_cot[eid][0] + edge_bending_cot[eid][1]
-    bend_weight[0] = -edge_bending_cot[eid][0] - edge_bending_cot[eid][2]
-    bend_weight[1] = -edge_bending_cot[eid][1] - edge_bending_cot[eid][3]
+    bend_weight[2] = cot[2] + cot[3]
+    bend_weight[3] = cot[0] + cot[1]
+    bend_weight[0] = -cot[0] - cot[2]
+    bend_weight[1] = -cot[1] - cot[3]
     bend_weight = bend_weight * edge_stiff
     for i in range(4):
         force = wp.vec3(0.0)
@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import warp as wp
+
+import newton
+from newton.solvers.euler.kernels import eval_spring_forces
+from newton.solvers.euler.particles import eval_particle_forces
+from newton.tests.unittest_utils import add_function_test, get_test_devices
+
+wp.config.quiet = True
+
+
+class TestEulerSolver(unittest.TestCase):
+    pass
+
+
+def build_particle_model(device):
+    builder = newton.ModelBuilder()
+    builder.add_particle_grid(
+        pos=wp.vec3(0.0, 0.0, 1.0),
+        rot=wp.quat_identity(),
+        vel=wp.vec3(0.0, 0.0, -1.0),
+        dim_x=4,
+        dim_y=4,
+        dim_z=4,
+        cell_x=0.09,
+        cell_y=0.09,
+        cell_z=0.09,
+        mass=0.1,
+        jitter=0.01,
+        radius_mean=0.05,
+    )
+    for i in range(0, builder.particle_count - 1, 2):
+        builder.add_spring(i, i + 1, 1.0e2, 1.0e-1, control=0.0)
+
+    return builder.finalize(device=device)
+
+
+def test_fused_particle_integration(test: TestEulerSolver, device, build_grid: bool):
+    model = build_particle_model(device)
+    solver = newton.solvers.SemiImplicitSolver(model)
+    dt = 1.0e-3
+
+    state_in = model.state()
+    if build_grid:
+        model.particle_grid.build(state_in.particle_q, model.particle_max_radius * 2.0)
+
+    # reference: unfused force evaluation followed by a separate integration pass
+    state_ref = model.state()
+    state_in.clear_forces()
+    eval_spring_forces(model, state_in, state_in.particle_f)
+    eval_particle_forces(model, state_in, state_in.particle_f)
+    solver.integrate_particles(model, state_in, state_ref, dt)
+    f_ref = state_in.particle_f.numpy()
+
+    # without particle-shape contacts the solver fuses particle-particle forces with the integration
+    state_out = model.state()
+    state_in.clear_forces()
+    solver.step(model, state_in, state_out, None, None, dt)
+
+    np.testing.assert_allclose(state_in.particle_f.numpy(), f_ref, rtol=1e-5, atol=1e-5)
+    np.testing.assert_allclose(state_out.particle_q.numpy(), state_ref.particle_q.numpy(), rtol=1e-5, atol=1e-6)
+    np.testing.assert_allclose(state_out.particle_qd.numpy(), state_ref.particle_qd.numpy(), rtol=1e-5, atol=1e-5)
+
+
+def build_cloth_model(device):
+    builder = newton.ModelBuilder()
+    builder.add_cloth_grid(
+        pos=wp.vec3(0.0, 0.0, 1.0),
+        rot=wp.quat_identity(),
+        vel=wp.vec3(0.0, 0.0, 0.0),
+        dim_x=6,
+        dim_y=4,
+        cell_x=0.1,
+        cell_y=0.1,
+        mass=0.1,
+        fix_left=True,
+        add_springs=True,
+        spring_ke=1.0e3,
+        spring_kd=1.0,
+        edge_ke=1.0e1,
+        edge_kd=1.0e-2,
+    )
+    model = builder.finalize(device=device)
+
+    rng = np.random.default_rng(123)
+    state = model.state()
+    state.particle_q.assign(state.particle_q.numpy() + rng.uniform(-0.01, 0.01, (model.particle_count, 3)))
+    state.particle_qd.assign(rng.uniform(-0.1, 0.1, (model.particle_count, 3)))
+
+    return model, state
+
+
+def test_force_accumulation(test: TestEulerSolver, device, solver_kwargs: dict, solver_attr: str):
+    model, state_in = build_cloth_model(device)
+    dt = 1.0e-3
+
+    results = []
+    for kwargs in ({}, solver_kwargs):
+        solver = newton.solvers.SemiImplicitSolver(model, **kwargs)
+        state_out = model.state()
+        state_in.clear_forces()
+        solver.step(model, state_in, state_out, None, None, dt)
+        results.append((state_in.particle_f.numpy(), state_out.particle_q.numpy(), state_out.particle_qd.numpy()))
+
+    # make sure the opt-in path was taken instead of silently falling back to the atomic one
+    test.assertIsNotNone(getattr(solver, solver_attr))
+
+    test.assertGreater(np.abs(results[0][0]).max(), 0.0)
+    for expected, actual in zip(*results):
+        np.testing.assert_allclose(actual, expected, rtol=1e-4, atol=1e-4)
+
+
+def test_element_coloring(test: TestEulerSolver, device):
+    model, _ = build_cloth_model(device)
+    solver = newton.solvers.SemiImplicitSolver(model, color_elements=True)
+    for color_groups, element_indices in (
+        (solver.tri_color_groups, model.tri_indices.numpy()),
+        (solver.edge_color_groups, model.edge_indices.numpy()),
+    ):
+        test.assertEqual(sum(group.size for group in color_groups), len(element_indices))
+        for group in color_groups:
+            vertices = element_indices[group.numpy()]
+            vertices = vertices[vertices >= 0]
+            test.assertEqual(len(np.unique(vertices)), len(vertices))
+
+
+devices = get_test_devices(mode="basic")
+
+add_function_test(
+    TestEulerSolver,
+    "test_fused_particle_integration",
+    test_fused_particle_integration,
+    devices=devices,
+    build_grid=True,
+)
+add_function_test(
+    TestEulerSolver,
+    "test_fused_particle_integration_no_grid",
+    test_fused_particle_integration,
+    devices=devices,
+    build_grid=False,
+)
+add_function_test(
+    TestEulerSolver,
+    "test_gather_forces",
+    test_force_accumulation,
+    devices=devices,
+    solver_kwargs={"gather_forces": True},
+    solver_attr="slot_f",
+)
+add_function_test(
+    TestEulerSolver,
+    "test_colored_forces",
+    test_force_accumulation,
+    devices=devices,
+    solver_kwargs={"color_elements": True},
+    solver_attr="tri_color_groups",
+)
+add_function_test(TestEulerSolver, "test_element_coloring", test_element_coloring, devices=devices)
+
+
+if __name__ == "__main__":
+    wp.clear_kernel_cache()
+    unittest.main(verbosity=2)
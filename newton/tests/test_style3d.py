@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 The Newton Developers
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+import warp as wp
+
+import newton
+from newton.solvers.style3d.kernels import eval_bend_kernel, eval_stretch_kernel
+from newton.tests.unittest_utils import add_function_test, get_cuda_test_devices, get_test_devices
+
+wp.config.quiet = True
+
+
+class TestStyle3D(unittest.TestCase):
+    pass
+
+
+def build_style3d_builder():
+    # jittered panel so that the triangles have no right angles and the cotangents are not
+    # exactly representable in float16, same for the stiffness values
+    rng = np.random.default_rng(7)
+    dim = 6
+    xs, ys = np.meshgrid(np.linspace(0.0, 0.5, dim), np.linspace(0.0, 0.4, dim))
+    panel_verts = np.stack((xs.ravel(), ys.ravel()), axis=-1) + rng.uniform(-0.02, 0.02, (dim * dim, 2))
+    vertices = np.concatenate((panel_verts, np.zeros((dim * dim, 1))), axis=-1)
+
+    indices = []
+    for j in range(dim - 1):
+        for i in range(dim - 1):
+            v = j * dim + i
+            indices.extend((v, v + 1, v + dim + 1, v, v + dim + 1, v + dim))
+
+    builder = newton.sim.Style3DModelBuilder()
+    builder.add_aniso_cloth_mesh(
+        pos=wp.vec3(0.0, 0.0, 1.0),
+        rot=wp.quat_identity(),
+        vel=wp.vec3(0.0, 0.0, 0.0),
+        scale=1.0,
+        density=0.3,
+        indices=np.asarray(indices, dtype=np.int32),
+        vertices=vertices.astype(np.float32),
+        panel_verts=panel_verts.astype(np.float32),
+        tri_aniso_ke=wp.vec3(123.456, 78.9012, 13.3713),
+        edge_aniso_ke=wp.vec3(2.3456e-5, 1.7891e-5, 5.9123e-6),
+    )
+    return builder
+
+
+def test_param_dtype_default(test: TestStyle3D, device):
+    model = build_style3d_builder().finalize(device=device)
+    test.assertIs(model.tri_aniso_ke.dtype, wp.vec3)
+    test.assertIs(model.edge_bending_cot.dtype, wp.vec4)
+
+
+def test_param_dtype_float16_forces(test: TestStyle3D, device):
+    builder = build_style3d_builder()
+    model_32 = builder.finalize(device=device)
+    model_16 = builder.finalize(device=device, param_dtype=wp.float16)
+
+    # the parameters must actually be rounded, otherwise the comparison below proves nothing
+    for param_32, param_16 in (
+        (model_32.tri_aniso_ke, model_16.tri_aniso_ke),
+        (model_32.edge_bending_cot, model_16.edge_bending_cot),
+    ):
+        test.assertEqual(param_16.dtype._wp_scalar_type_, wp.float16)
+        values_32 = param_32.numpy()
+        values_16 = param_16.numpy().astype(np.float32)
+        test.assertGreater(np.abs(values_16 - values_32).max(), 0.0)
+        np.testing.assert_allclose(values_16, values_32, rtol=1.0e-3)
+
+    rng = np.random.default_rng(123)
+    pos = wp.array(
+        model_32.particle_q.numpy() + rng.uniform(-0.02, 0.02, (model_32.particle_count, 3)),
+        dtype=wp.vec3,
+        device=device,
+    )
+
+    for kernel in (eval_stretch_kernel, eval_bend_kernel):
+        forces = []
+        for model in (model_32, model_16):
+            f = wp.zeros(model.particle_count, dtype=wp.vec3, device=device)
+            if kernel is eval_stretch_kernel:
+                inputs = [pos, model.tri_areas, model.tri_poses, model.tri_indices, model.tri_aniso_ke]
+                dim = model.tri_count
+            else:
+                inputs = [
+                    pos,
+                    model.edge_rest_area,
+                    model.edge_bending_cot,
+                    model.edge_indices,
+                    model.edge_bending_properties,
+                ]
+                dim = model.edge_count
+            wp.launch(kernel, dim=dim, inputs=inputs, outputs=[f], device=device)
+            forces.append(f.numpy())
+
+        f_max = np.abs(forces[0]).max()
+        test.assertGreater(f_max, 0.0)
+        np.testing.assert_allclose(forces[1], forces[0], rtol=0.0, atol=2.0e-3 * f_max)
+
+
+def test_param_dtype_float16_solver(test: TestStyle3D, device):
+    builder = build_style3d_builder()
+    positions = []
+    for param_dtype in (wp.float32, wp.float16):
+        model = builder.finalize(device=device, param_dtype=param_dtype)
+        solver = newton.solvers.Style3DSolver(model, 10)
+        solver.precompute(builder)
+        states = [model.state(), model.state()]
+        control = model.control()
+        for _ in range(10):
+            solver.step(model, states[0], states[1], control, None, 1.0 / 120.0)
+            states.reverse()
+        positions.append(states[0].particle_q.numpy())
+
+    test.assertGreater(np.abs(positions[0] - np.asarray(builder.particle_q)).max(), 0.0)
+    np.testing.assert_allclose(positions[1], positions[0], rtol=0.0, atol=1.0e-3)
+
+
+devices = get_test_devices(mode="basic")
+# the Style3D linear solver relies on device-only reductions
+cuda_devices = get_cuda_test_devices(mode="basic")
+
+add_function_test(TestStyle3D, "test_param_dtype_default", test_param_dtype_default, devices=devices)
+add_function_test(TestStyle3D, "test_param_dtype_float16_forces", test_param_dtype_float16_forces, devices=devices)
+# Style3DSolver.precompute() reports its timing, so the output is not checked
+add_function_test(
+    TestStyle3D,
+    "test_param_dtype_float16_solver",
+    test_param_dtype_float16_solver,
+    devices=cuda_devices,
+    check_output=False,
+)
+
+
+if __name__ == "__main__":
+    wp.clear_kernel_cache()
+    unittest.main(verbosity=2)